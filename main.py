@@ -1,6 +1,7 @@
 import csv
 import os
 import sys
+import time
 import datetime
 from userinput import *
 from xpathscraper import XpathScraper
@@ -50,7 +51,9 @@ def read_final_result(filename):
 
 def add_days(date: str | datetime.datetime | datetime.date, delta: int):
     '''return always a datetime.date obj'''
-    if isinstance(date, (datetime.datetime, datetime.date)):
+    if isinstance(date, datetime.datetime):
+        return date.date() + datetime.timedelta(days=delta)
+    elif isinstance(date, datetime.date):
         return date + datetime.timedelta(days=delta)
     elif isinstance(date, str):
         return (datetime.datetime.strptime(date, '%Y-%m-%d') + datetime.timedelta(days=delta)).date()
@@ -58,9 +61,10 @@ def add_days(date: str | datetime.datetime | datetime.date, delta: int):
 
 def datetime_to_str(date: datetime.datetime | datetime.date):
     '''from datetime|date to str'''
-    if isinstance(date, (datetime.datetime, datetime.date)):
-        date_str = date.strftime('%Y-%m-%d')
-        return date_str
+    if isinstance(date, datetime.datetime):
+        return date.date().isoformat()
+    elif isinstance(date, datetime.date):
+        return date.isoformat()
 
 
 def get_first_weekend_day(date: datetime.datetime | datetime.date):
@@ -113,11 +117,11 @@ def is_file_not_empty(file_path):
     return os.path.isfile(file_path) and os.path.getsize(file_path) > 0
 
 
-def add_list_to_csv_file(my_list: list, filename: str):
+def add_list_to_csv_file(my_list: list, writer, file):
+    '''write a row with the writer of the already open CSV file, flushed so a crash does not lose it'''
     try:
-        with open(filename, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(my_list)
+        writer.writerow(my_list)
+        file.flush()
     except Exception as e:
         logger.exception(e)
 
@@ -138,7 +142,7 @@ def scrape_go(from_: str, to_: str, outbound_: str, inbound_: str, fast=False, t
         url = url_builder(from_, to_, outbound_, inbound_, tclass)
         # Take outbound info for the first flight sorted and append to list
         results = results + scraper.get_elements_from_xpath_list(
-            url, XPATH_LIST)
+            url, XPATH_LIST, XP_NOT_FOUND)
         # If results list is empty, try catch the cause message
         if not results:
             results = [scraper.scrape(None, XP_NOT_FOUND_MESSAGE)]
@@ -162,53 +166,62 @@ def scrape_go(from_: str, to_: str, outbound_: str, inbound_: str, fast=False, t
     return format_result(outbound_, inbound_, results)
 
 
-def start_search(from_: list, to_: list, outbound_: datetime, inbound_: datetime, flexdays: int, lastdate_: datetime, fastmode_=False, weekend=False):
+def build_schedule(outbound_: datetime.date, delta: int, period: int, flexdays: int, lastdate_: datetime.date, weekend=False):
+    '''return the list of (outbound, [inbound, ...]) date str to search for every airport pair'''
+    schedule = []
+    i_weekend = 0
+    for i in range(period):
+        # Departure flight date is given by "outbound_" (date) + index (int) + (if True) index_weekend (int)
+        outbound_date = add_days(outbound_, i+i_weekend)
+        # If weekend increment index i_weekend +5
+        if weekend:
+            outbound_date = get_first_weekend_day(
+                date=outbound_date)
+            i_weekend += 5
+        # Check for last avaiable departure date, if True stop here
+        if lastdate_ == outbound_date:
+            break
+        # Convert out and in dates for scraper
+        inbound_dts = [datetime_to_str(add_days(outbound_date, delta))]
+        # If flexibiliy iterate over flexdays for the return flight date
+        if flexdays:
+            for j in range(flexdays):
+                inbound_dts.append(datetime_to_str(
+                    add_days(outbound_date, j+1+delta)))
+        schedule.append((datetime_to_str(outbound_date), inbound_dts))
+    return schedule
+
+
+def start_search(from_: list, to_: list, outbound_: datetime.date, inbound_: datetime.date, flexdays: int, lastdate_: datetime.date, fastmode_=False, weekend=False):
     start_time = datetime.datetime.now()
+    # Drop duplicate airport codes (order preserved), each one would repeat the whole search
+    unique_from, unique_to = list(dict.fromkeys(from_)), list(dict.fromkeys(to_))
+    if len(unique_from) != len(from_) or len(unique_to) != len(to_):
+        logger.warning('Duplicate airport codes removed from search.')
+    from_, to_ = unique_from, unique_to
     delta = inbound_ - outbound_
     period = lastdate_ - outbound_
-    i_weekend = 0
     count = 0
+    # Dates are the same for every airport pair, compute them once
+    schedule = build_schedule(outbound_, delta.days, period.days,
+                              flexdays, lastdate_, weekend)
     try:
-        # Iterate over from_ and to_ airport codes list
-        for f in from_:
-            for t in to_:
-                for i in range(period.days):
-                    # If found too many not found break loop
-                    if len(not_found) >= 5:
-                        logger.info("Skipping because too many search with no result.")
-                        not_found.clear()
-                        break
-                    # Reset i_weekend counter
-                    if i == 0:
-                        i_weekend = 0
-                    # Departure flight date is given by "outbound_" (date) + index (int) + (if True) index_weekend (int)
-                    outbound_date = add_days(outbound_, i+i_weekend)
-                    # If weekend increment index i_weekend +5
-                    if weekend:
-                        outbound_date = get_first_weekend_day(
-                            date=outbound_date)
-                        i_weekend += 5
-                    # Convert out and in dates for scraper
-                    outbound_dt = datetime_to_str(outbound_date)
-                    inbound_dt = datetime_to_str(
-                        add_days(outbound_date, delta.days))
-                    # Check for last avaiable departure date, if True skip to next destination
-                    if lastdate_ == outbound_date:
-                        break
-                    # Pass converted str to scraper and append to CSV file
-                    add_list_to_csv_file(
-                        scrape_go(f, t, outbound_dt, inbound_dt, fastmode_), filename)
-                    # Count +1
-                    count += 1
-                    # If flexibiliy iterate over flexdays for the return flight date
-                    if flexdays:
-                        for j in range(flexdays):
-                            inbound_date = add_days(outbound_date, j+1)
-                            inbound_dt = datetime_to_str(
-                                add_days(inbound_date, delta.days))
+        # Keep the CSV file open for the whole search instead of reopening it for every row
+        with open(filename, mode='a', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            # Iterate over from_ and to_ airport codes list
+            for f in from_:
+                for t in to_:
+                    for outbound_dt, inbound_dts in schedule:
+                        # If found too many not found break loop
+                        if len(not_found) >= 5:
+                            logger.info("Skipping because too many search with no result.")
+                            not_found.clear()
+                            break
+                        for inbound_dt in inbound_dts:
                             # Pass converted str to scraper and append to CSV file
                             add_list_to_csv_file(
-                                scrape_go(f, t, outbound_dt, inbound_dt, fastmode_), filename)
+                                scrape_go(f, t, outbound_dt, inbound_dt, fastmode_), writer, file)
                             # Count +1
                             count += 1
     except KeyboardInterrupt:
@@ -224,6 +237,7 @@ if __name__ == "__main__":
     today = datetime.datetime.now().date()
     print_welcome_message()
     filename = None
+    scraper = None
     not_found = []
     from_ = []
     to_ = []
@@ -289,14 +303,15 @@ if __name__ == "__main__":
             # Prompt for start search, else go to begin
             if ui.yes_or_not("\n[>] Do you want to start search?"):
                 prefix = '-'.join(from_) + 'to' + '-'.join(to_)
-                filename = f"{results_path}{prefix}_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}.csv"
-                # Init the xpath scraper driver
-                scraper = XpathScraper(timeout=timeout_)
+                filename = f"{results_path}{prefix}_{time.strftime('%Y%m%d%H%M%S')}.csv"
+                # Init the xpath scraper driver once, next searches reuse the warm browser
+                if scraper is None:
+                    scraper = XpathScraper(timeout=timeout_)
+                else:
+                    scraper.set_timeout(timeout_)
                 # Start search
                 start_search(from_, to_, outbound_, inbound_,
                              flexdays_, lastdate_, fastmode_, weekend_)
-                # Quit the driver
-                scraper.quit()
                 # Sort:
                 read_final_result(filename)
             else:
@@ -305,4 +320,8 @@ if __name__ == "__main__":
         exit_app('Script terminated by user.', filename)
     except Exception as e:
         logger.exception(e)
-        exit_app(e, filename, error=True)
\ No newline at end of file
+        exit_app(e, filename, error=True)
+    finally:
+        # Quit the driver
+        if scraper is not None:
+            scraper.quit()
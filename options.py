@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+from types import MappingProxyType
 from base_logger import logger
 
 def update_settings_file(data: dict):
@@ -13,30 +14,41 @@ def update_settings_file(data: dict):
         raise (f'[ERROR] {e}')
 
 
-def read_settings_file():
+def load_settings_file():
+    '''return (data, error) where error is None, missing, malformed or empty_field'''
     try:
         with open(settings_file, 'r') as f:
             data = json.load(f)
-            for d in data:
-                if data[d] in ("", " ", []):
-                    logger.exception(
-                        f"No value in \'{d}\' of settings.json file.")
-                    raise json.JSONDecodeError("", "", 0)
-            return data
     except FileNotFoundError:
-        with open(settings_file, 'w+', encoding='utf-8') as f:
-            json.dump(json.loads(DEFATULT_SETTINGS), f, indent=4)
-            f.seek(0)
-            logger.info('Restoring default settings.json file.')
-            return json.load(f)
+        return None, 'missing'
     except json.JSONDecodeError:
-        logger.exception("settings.json file not readable.")
-        os.remove(settings_file)
-        return read_settings_file()
+        return None, 'malformed'
+    # Collect every empty key in one pass and report them together
+    empty = [k for k, v in data.items() if v in ("", " ", [])]
+    if empty:
+        logger.error(
+            f"No value in {', '.join(empty)} of settings.json file.")
+        return data, 'empty_field'
+    return data, None
+
+
+def read_settings_file():
+    try:
+        data, error = load_settings_file()
+        if error is None:
+            return data
+        elif error in ('malformed', 'empty_field'):
+            logger.error("settings.json file not readable.")
+        # Missing or not usable: write the default settings and use them
+        with open(settings_file, 'w', encoding='utf-8') as f:
+            data = json.loads(DEFATULT_SETTINGS)
+            json.dump(data, f, indent=4)
+            logger.info('Restoring default settings.json file.')
+            return data
     except Exception as e:
         logger.error(e)
         sys.exit()
-        
+
 
 # Airport codes file
 try: 
@@ -45,8 +57,9 @@ except:
     AIRPORT_CODES_FILE ='airport_codes.xls.xlsx'
 # Settings file and results directory for CSV file
 try:
-    settings_file = os.path.join(os.getcwd(), 'settings.json')
-    results_path = os.path.join(os.getcwd(), 'results', '')
+    CWD = os.getcwd()
+    settings_file = os.path.join(CWD, 'settings.json')
+    results_path = os.path.join(CWD, 'results', '')
     os.makedirs(results_path, exist_ok=True)
     # chromedriver_path = os.path.join(os.getcwd(), 'chromedriver', 'chromedriver.exe')
 except Exception as e:
@@ -64,17 +77,17 @@ XP_STOPS = '''//*[@id="yDmH0d"]/c-wiz[2]/div/div[2]/c-wiz/div[1]/c-wiz/div[2]/di
 XP_CLICK_FIRST_SORTED = '''//*[@id="yDmH0d"]/c-wiz[2]/div/div[2]/c-wiz/div[1]/c-wiz/div[2]/div[2]/div[3]/ul/li[1]/div/div[2]'''
 XP_NOT_FOUND = '''//*[@id="yDmH0d"]/c-wiz[2]/div/div[2]/c-wiz/div[1]/c-wiz/div[2]/div[2]/div[2]/p[1]'''
 XP_NOT_FOUND_MESSAGE = '''//*[@id="yDmH0d"]/c-wiz[2]/div/div[2]/c-wiz/div[1]/c-wiz/div[2]/div[2]/div[2]/p[2]'''
-# Keys and values
-XPATH_DICT = { 
+# Keys and values (read-only, built once at import)
+XPATH_DICT = MappingProxyType({
     'codes':XP_AIRPORT_CODES,
     'price': XP_PRICE,
     'company':XP_COMPANY,
     'type': XP_TYPE,
     'duration':XP_DURATION,
     'stops':XP_STOPS,
-}
-XPATH_KEYS = [k for k, v in XPATH_DICT.items()]
-XPATH_LIST = [str(v) for v in XPATH_DICT.values()]
+})
+XPATH_KEYS = tuple(XPATH_DICT.keys())
+XPATH_LIST = tuple(XPATH_DICT.values())
 # Default settings.json
 DEFATULT_SETTINGS = '''
 {
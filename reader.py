@@ -7,7 +7,8 @@ KEYS = ['outbound', 'inbound', 'codes', 'price', 'company', 'info', 'duration',
 class ReadResult():
     def __init__(self, filename) -> None:
         self.filename = filename
-        self.df = pd.read_csv(filename, header=None)      
+        # Every scraped field is text: skip pandas' per-column type inference
+        self.df = pd.read_csv(filename, header=None, dtype=str)
         # Check if number of columns in the file is greater than the length of the header KEYS
         if len(self.df.columns) > len(KEYS):
             new_header = KEYS + [f"return_{col}" for col in KEYS[2:]]
@@ -19,18 +20,12 @@ class ReadResult():
         # self.df = self.df.dropna(subset=['price'])    
         
     def sort_by_price(self, col_name='price'):
-        def extract_price(s):
-            try:
-                if isinstance(s, str):
-                    return int(float((s.split(' ')[0]).replace('.','')))
-                elif pd.isna(s):
-                    return 0
-                else:
-                    return int(s)
-            except:
-                return 0
-        self.df[col_name] = self.df[col_name].fillna('0 €')
-        self.df[col_name] = self.df[col_name].apply(extract_price)
+        # Vectorized "1.234 €" -> 1234 (unparsable values become 0)
+        prices = self.df[col_name].fillna('0 €')
+        prices = prices.str.split(' ', n=1).str[0].str.replace('.', '', regex=False)
+        prices = pd.to_numeric(prices, errors='coerce')
+        prices = prices.where(prices.abs() != float('inf'))
+        self.df[col_name] = prices.fillna(0).astype('int64')
         sorted_df = self.df[self.df[col_name] != 0].sort_values(col_name)
         logger.info(f'Flights sorted by price:\n{sorted_df.head()}')
         return sorted_df
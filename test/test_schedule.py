@@ -0,0 +1,65 @@
+import os
+import sys
+import datetime
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+
+def baseline_dates(outbound_, inbound_, flexdays, lastdate_, weekend=False):
+    '''(outbound, inbound) str pairs in the order the search loop used to scrape them for one airport pair'''
+    dates = []
+    delta = inbound_ - outbound_
+    period = lastdate_ - outbound_
+    for i in range(period.days):
+        if i == 0:
+            i_weekend = 0
+        outbound_date = main.add_days(outbound_, i+i_weekend)
+        if weekend:
+            outbound_date = main.get_first_weekend_day(date=outbound_date)
+            i_weekend += 5
+        outbound_dt = main.datetime_to_str(outbound_date)
+        inbound_dt = main.datetime_to_str(main.add_days(outbound_date, delta.days))
+        if lastdate_ == outbound_date:
+            break
+        dates.append((outbound_dt, inbound_dt))
+        if flexdays:
+            for j in range(flexdays):
+                inbound_date = main.add_days(outbound_date, j+1)
+                inbound_dt = main.datetime_to_str(main.add_days(inbound_date, delta.days))
+                dates.append((outbound_dt, inbound_dt))
+    return dates
+
+
+def schedule_dates(outbound_, inbound_, flexdays, lastdate_, weekend=False):
+    '''(outbound, inbound) str pairs in the order start_search scrapes them from build_schedule'''
+    delta = inbound_ - outbound_
+    period = lastdate_ - outbound_
+    schedule = main.build_schedule(outbound_, delta.days, period.days, flexdays, lastdate_, weekend)
+    return [(outbound_dt, inbound_dt) for outbound_dt, inbound_dts in schedule for inbound_dt in inbound_dts]
+
+
+class TestBuildSchedule(unittest.TestCase):
+    def check(self, outbound_, delta, flexdays, lastdate_, weekend):
+        inbound_ = main.add_days(outbound_, delta)
+        expected = baseline_dates(outbound_, inbound_, flexdays, lastdate_, weekend)
+        self.assertTrue(expected)
+        self.assertEqual(schedule_dates(outbound_, inbound_, flexdays, lastdate_, weekend), expected)
+        return expected
+
+    def test_weekend(self):
+        self.check(datetime.date(2023, 10, 4), 2, 0, datetime.date(2023, 12, 20), weekend=True)
+
+    def test_flexdays(self):
+        dates = self.check(datetime.date(2023, 10, 1), 20, 4, datetime.date(2023, 10, 15), weekend=False)
+        self.assertEqual(len(dates), 14 * 5)
+
+    def test_lastdate_stop(self):
+        # 2023-10-21 is a Saturday: the weekend search stops there
+        lastdate_ = datetime.date(2023, 10, 21)
+        dates = self.check(datetime.date(2023, 10, 2), 1, 1, lastdate_, weekend=True)
+        self.assertNotIn(main.datetime_to_str(lastdate_), [outbound_dt for outbound_dt, _ in dates])
+
+
+if __name__ == '__main__':
+    unittest.main()
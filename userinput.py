@@ -1,9 +1,30 @@
 import pandas as pd
 import datetime
+import functools
 from options import AIRPORT_CODES_FILE
 # file_name = 'airport_codes.xls.xlsx'
 
 
+@functools.lru_cache(maxsize=1)
+def load_airports():
+    '''read the airport codes file once, with lowercase columns for the searches'''
+    df = pd.read_excel(AIRPORT_CODES_FILE)
+    df['airport_lc'] = df['Airport'].str.lower()
+    df['country_lc'] = df['Country'].str.lower()
+    # Sort by name once so prefix searches are binary searches (stable: file order kept for equal names)
+    return df.sort_values('airport_lc', kind='stable').reset_index(drop=True)
+
+
+@functools.lru_cache(maxsize=1)
+def load_airport_codes():
+    '''map airport name to code, the first one in the file for duplicated names'''
+    df = load_airports()
+    airport_codes = {}
+    for airport, code in zip(df['Airport'].tolist(), df['Code'].tolist()):
+        airport_codes.setdefault(airport, code)
+    return airport_codes
+
+
 class UserInput():
     def __init__(self) -> None:
         pass
@@ -66,8 +87,8 @@ class UserInput():
     def select_airport(self, message):
         print(message)
         codes = []
-        # Load the data from the Excel file
-        df = pd.read_excel(AIRPORT_CODES_FILE)
+        # Load the data from the Excel file (cached after the first call)
+        df = load_airports()
         while True:
             # Prompt the user for the string to search for and the country to filter by
             airport = input(
@@ -78,14 +99,15 @@ class UserInput():
             if not airport and not country:
                 print("Please enter at least one CITY or a COUNTRY.")
                 continue
-            # Create a boolean mask to filter by country
+            # Look up the airports that start with the specified string: names are sorted,
+            # so they are the contiguous slice found by two binary searches
+            first = df['airport_lc'].searchsorted(airport, side='left')
+            last = df['airport_lc'].searchsorted(airport + '\uffff', side='right')
+            result_df = df.iloc[first:last]
+            # Filter by country (if specified)
             if country:
-                mask = (df['Country'].str.lower() == country)
-            else:
-                mask = True
-            # Look up the airports that start with the specified string and match the country (if specified)
-            result_df = df.loc[mask & df['Airport'].str.lower(
-            ).str.startswith(airport), 'Airport']
+                result_df = result_df[result_df['country_lc'] == country]
+            result_df = result_df['Airport']
             # Check if the result is empty
             if result_df.empty:
                 print(
@@ -114,8 +136,9 @@ class UserInput():
                     except (ValueError, IndexError):
                         print('Invalid input, please try again.')
                 # Look up the airport codes in the DataFrame print and append them
+                airport_codes = load_airport_codes()
                 for airport in selected_airports:
-                    code = df.loc[df['Airport'] == airport, 'Code'].iloc[0]
+                    code = airport_codes[airport]
                     codes.append(code)
                     print(f'The code for {airport} is {code}.')
                 # Print all codes
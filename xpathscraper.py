@@ -16,9 +16,34 @@ IGNORED_EXCEPTION = (NoSuchElementException,TimeoutException,StaleElementReferen
 # 2: Display all messages except debug messages
 # 3: Display all messages except debug and informational messages
 # 99: Debugging messages are displayed
+# Seconds between page readiness checks
+READY_POLL_FREQUENCY = 0.1
+# Requests not needed to read the results (ads, analytics, fonts)
+BLOCKED_URLS = [
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*/log?*',
+    '*.woff2',
+    '*.woff',
+    '*.ttf',
+]
+# True when every xpath (or the optional "not found" xpath) is in the page
+JS_XPATHS_READY = '''
+function found(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+}
+return (arguments[1] !== null && found(arguments[1])) || arguments[0].every(found);'''
+# Read the text of every xpath in a single round-trip (null if not found)
+JS_XPATH_TEXTS = '''
+return arguments[0].map(function (xpath) {
+    var node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node ? (node.innerText !== undefined ? node.innerText : node.textContent) : null;
+});'''
 
 class XpathScraper:
-    def __init__(self, timeout, options=None):
+    def __init__(self, timeout, options=None, page_load_timeout=30, block_urls=None):
         if not options:
             options = webdriver.ChromeOptions()
             # set log level to suppress INFO messages
@@ -35,18 +60,46 @@ class XpathScraper:
             # Add the following lines to click the "Accept all" button
             options.add_argument('--disable-notifications')
             options.add_argument('--disable-web-security')
-            options.add_argument('--disable-features=site-per-process')
+            # Chrome keeps only the last --disable-features switch, list them all here
+            options.add_argument('--disable-features=site-per-process,Translate,MediaRouter,OptimizationHints')
             options.add_argument('--disable-save-password-bubble')
             options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option('prefs', {'profile.default_content_setting_values.cookies': 2})            
+            # Only the page text is scraped: skip images, GPU and audio work
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--mute-audio')
+            # No background networking/throttling work while scraping
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-background-timer-throttling')
+            options.add_argument('--disable-renderer-backgrounding')
+            options.add_experimental_option('prefs', {
+                'profile.default_content_setting_values.cookies': 2,
+                'profile.default_content_setting_values.notifications': 2,
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.plugins': 2,
+            })
+            # driver.get returns on DOMContentLoaded, the xpath waits handle the rest
+            options.page_load_strategy = 'eager'
             
         #self.driver = webdriver.Chrome(executable_path=driver_path, options=options)
         self.driver = webdriver.Chrome(ChromeDriverManager().install(), options=options)
-        self.timeout = timeout
+        # A stuck navigation raises TimeoutException instead of blocking the search (and CTRL+C)
+        self.driver.set_page_load_timeout(page_load_timeout)
+        # Drop ads/analytics/fonts requests before they hit the network (block_urls=[] to disable)
+        if block_urls is None:
+            block_urls = BLOCKED_URLS
+        if block_urls:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(block_urls)})
+        self.set_timeout(timeout)
         
         
     def set_timeout(self, timeout):
         self.timeout = timeout
+        # One wait object reused by every lookup, rebuilt only when the timeout changes
+        self.wait = WebDriverWait(self.driver, timeout)
+        # Page readiness is a cheap probe, poll it faster than the default 0.5s
+        self.ready_wait = WebDriverWait(self.driver, timeout, poll_frequency=READY_POLL_FREQUENCY)
 
 
     def quit(self):
@@ -57,7 +110,7 @@ class XpathScraper:
         if url:
             self.driver.get(url)
         try:
-            element = WebDriverWait(self.driver, self.timeout).until(
+            element = self.wait.until(
                 EC.presence_of_element_located((By.XPATH, xpath))
             )
             return element.text
@@ -70,16 +123,27 @@ class XpathScraper:
             logger.error(e.__class__) 
         
 
-    def get_elements_from_xpath_list(self, url:str, xpath_list:list):
+    def get_elements_from_xpath_list(self, url:str, xpath_list:list, not_found_xpath:str=None):
         element_text_list = []
         if url:
             self.driver.get(url)
+        if not xpath_list:
+            return element_text_list
+        xpath_list = list(xpath_list)
         try:
-            for xpath in xpath_list:
-                element = WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.XPATH, xpath))
+            # Wait until the page shows all the elements (or the "not found" message) with one probe per poll
+            try:
+                self.ready_wait.until(
+                    lambda driver: driver.execute_script(JS_XPATHS_READY, xpath_list, not_found_xpath)
                 )
-                element_text_list.append(element.text)
+            except TimeoutException as e:
+                # Not all of them showed up in time: read the ones that did
+                logger.error(e.__class__)
+            for text in self.driver.execute_script(JS_XPATH_TEXTS, xpath_list):
+                # Keep the elements found before the first missing one
+                if text is None:
+                    break
+                element_text_list.append(text)
         except (NoSuchElementException,TimeoutException,StaleElementReferenceException) as e:
             logger.error(e.__class__)
         except (NoSuchWindowException) as e:
@@ -94,7 +158,7 @@ class XpathScraper:
         if url:
             self.driver.get(url)
         try:
-            element = WebDriverWait(self.driver, self.timeout).until(
+            element = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, xpath))
             )
             element.click()
@@ -108,7 +172,7 @@ class XpathScraper:
         if url:
             self.driver.get(url)        
         try:
-            element = WebDriverWait(self.driver, self.timeout).until(
+            element = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, xpath))
             )
             element.click()
@@ -122,7 +186,7 @@ class XpathScraper:
         if url:
             self.driver.get(url)     
         try:
-            element = WebDriverWait(self.driver, self.timeout).until(
+            element = self.wait.until(
                 EC.presence_of_element_located((By.XPATH, xpath))
             )
             element.send_keys(text)